@@ -2,54 +2,88 @@
 
 import argparse
 import asyncio
+import functools
 import json
+import math
+import os
 import re
+import string
 import sys
+import time
 import urllib.request
 from concurrent.futures import ThreadPoolExecutor, as_completed
 
-
-def _escape_re(s: str) -> str:
-    return re.escape(str(s))
-
-
-def extract_text_by_id(html: str, element_id: str):
-    # Stooq often uses unquoted attributes: id=aq_gc.f_c2|3
-    # Accept both quoted and unquoted id values.
-    id_esc = _escape_re(element_id)
-    pat = re.compile(r"\bid=(?:[\"']?%s[\"']?)[^>]*>([^<]*)<" % id_esc, re.IGNORECASE)
-    last = None
-    for m in pat.finditer(html):
-        last = m.group(1)
-    if last is None:
+try:
+    from selectolax.lexbor import LexborHTMLParser as HTMLParser  # type: ignore
+except Exception:
+    # Optional: without selectolax, ids are extracted with the regex scan below.
+    HTMLParser = None
+
+try:
+    import aiohttp  # type: ignore
+except Exception:
+    # Optional: without aiohttp, HTTP mode falls back to urllib on a thread pool.
+    aiohttp = None
+
+try:
+    import orjson  # type: ignore
+except Exception:
+    # Optional: without orjson, JSON output goes through the stdlib encoder.
+    orjson = None
+
+
+# Field id suffixes of a quote page: aq_{sym}_d2, aq_{sym}_t1, ..., aq_{sym}_c2|3.
+_FIELD_ID_SUFFIXES = rb"d2|t1|m2|m3|h|l|o|p|v2|r2|c[0-9]\|3"
+# symbol -> compiled alternation over that symbol's field ids (see _fields_re).
+_FIELDS_RE_CACHE = {}
+
+# "10.6k", "730m" seen on BTC.V volume/turnover.
+_SUFFIX_RE = re.compile(r"^([+-]?\d+(?:\.\d+)?)([kKmMgGbB])$")
+# Stooq uses: k=thousand, m=million, g=billion, b=billion.
+_SUFFIX_MULT = {"k": 1e3, "K": 1e3, "m": 1e6, "M": 1e6, "g": 1e9, "G": 1e9, "b": 1e9, "B": 1e9}
+# Thousands separators and embedded whitespace: "2,034.5", "1 234".
+_STRIP_RE = re.compile(r"[,\s]")
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_float_with_suffix(t: str):
+    # Kernel for parse_number_loose; `t` is already stripped and non-empty.
+    # Cached: the same raw strings ("0", "-", repeated prices) recur across fields and symbols.
+    # Most fields are plain numbers like "123.45": one float() call, no regex.
+    try:
+        return float(t)
+    except ValueError:
+        pass
+    mult = _SUFFIX_MULT.get(t[-1])
+    if mult is not None:
+        m = _SUFFIX_RE.match(t)
+        if m:
+            return float(m.group(1)) * mult
+    t = _STRIP_RE.sub("", t)
+    try:
+        return float(t)
+    except ValueError:
         return None
-    return last.strip()
 
 
 def parse_number_loose(s):
     if s is None:
         return None
-    t = str(s).strip()
+    t = s if isinstance(s, str) else str(s)
+    # Values from the page are usually stripped already; only strip when an end is whitespace.
+    if t[:1].isspace() or t[-1:].isspace():
+        t = t.strip()
     if not t:
         return None
-    m = re.match(r"^([+-]?\d+(?:\.\d+)?)([kKmMgGbB])$", t)
-    if m:
-        n = float(m.group(1))
-        unit = m.group(2).lower()
-        # Stooq uses: k=thousand, m=million, g=billion, b=billion.
-        mult = 1e3 if unit == "k" else 1e6 if unit == "m" else 1e9
-        return n * mult
-    t = re.sub(r"[,\s]", "", t)
-    try:
-        return float(t)
-    except ValueError:
-        return None
+    return _parse_float_with_suffix(t)
 
 
 def parse_pct_loose(s):
     if s is None:
         return None
-    t = str(s).strip()
+    t = s if isinstance(s, str) else str(s)
+    if t[:1].isspace() or t[-1:].isspace():
+        t = t.strip()
     if not t:
         return None
     if t.startswith("(") and t.endswith(")"):
@@ -59,15 +93,54 @@ def parse_pct_loose(s):
     return parse_number_loose(t)
 
 
-def parse_quote_html(html: str, symbol: str):
-    sym = str(symbol).lower()
+def _fields_re(sym: str):
+    # One pattern matching every field id of `sym`, so the page is scanned once.
+    pat = _FIELDS_RE_CACHE.get(sym)
+    if pat is None:
+        pat = re.compile(
+            rb"\bid=[\"']?(aq_" + re.escape(sym.encode("utf-8")) + rb"_(?:" + _FIELD_ID_SUFFIXES + rb"))(?=[\s\"'>])[\"']?[^>]*>([^<]*)<",
+            re.IGNORECASE,
+        )
+        _FIELDS_RE_CACHE[sym] = pat
+    return pat
+
+
+def _leading_text(node) -> str:
+    # Text before the element's first child tag, like the regex path's `>([^<]*)<`.
+    child = node.child
+    if child is not None and child.tag == "-text":
+        return (child.text_content or "").strip()
+    return ""
+
+
+def _extract_ids(html, sym: str) -> dict:
+    if HTMLParser is not None:
+        # Parse the DOM once and select every quote element in a single traversal.
+        tree = HTMLParser(html)
+        return {
+            node.attributes["id"].lower(): _leading_text(node)
+            for node in tree.css('[id^="aq_" i]')
+        }
+    if isinstance(html, str):
+        html = html.encode("utf-8")
+    # Scan the raw bytes and decode only the captured ids/values.
+    # Later occurrences overwrite earlier ones, so the last occurrence of an id wins.
+    return {
+        k.decode("utf-8", errors="ignore").lower(): v.strip().decode("utf-8", errors="ignore")
+        for k, v in _fields_re(sym).findall(html)
+    }
+
+
+def parse_quote_html(html, sym: str, include_raw: bool = True):
+    # `sym` is expected lowercase already; parse_symbols normalizes once up front.
+    by_id = _extract_ids(html, sym)
     # "Last" id varies by instrument: c0|3, c2|3, c3|3, ...
     last_candidates = [2, 0, 3, 1, 4, 5, 6, 7, 8, 9]
     last_id = None
     last_raw = None
     for d in last_candidates:
         eid = f"aq_{sym}_c{d}|3"
-        v = extract_text_by_id(html, eid)
+        v = by_id.get(eid)
         if v is not None:
             last_id = eid
             last_raw = v
@@ -86,7 +159,7 @@ def parse_quote_html(html: str, symbol: str):
         "turnover": f"aq_{sym}_r2",
     }
 
-    raw = {k: extract_text_by_id(html, element_id) for k, element_id in ids.items()}
+    raw = {k: by_id.get(element_id) for k, element_id in ids.items()}
     raw["last"] = last_raw
     raw["last_id"] = last_id
 
@@ -104,8 +177,9 @@ def parse_quote_html(html: str, symbol: str):
         "prev": parse_number_loose(raw["prev"]),
         "volume": parse_number_loose(raw["volume"]),
         "turnover": parse_number_loose(raw["turnover"]),
-        "raw": raw,
     }
+    if include_raw:
+        out["raw"] = raw
     return out
 
 
@@ -114,79 +188,89 @@ def validate_parsed_quote(q: dict) -> bool:
     return all(q.get(k) is not None for k in required)
 
 
-def fetch_quote_html(symbol: str, timeout_ms: int) -> str:
-    sym = str(symbol).lower()
-    url = f"https://stooq.com/q/?s={urllib.request.quote(sym)}"
-    req = urllib.request.Request(
-        url,
-        headers={
-            "User-Agent": "stooq-quote-fetcher/0.1 (+https://stooq.com/)",
-            "Accept": "text/html,application/xhtml+xml",
-            "Accept-Language": "en-US,en;q=0.9",
-        },
-        method="GET",
-    )
-    with urllib.request.urlopen(req, timeout=timeout_ms / 1000.0) as resp:
-        return resp.read().decode("utf-8", errors="ignore")
+# Typical Stooq symbols (gc.f, btc.v, 8002.jp) need no percent-encoding.
+_SYM_SAFE = frozenset(string.ascii_lowercase + string.digits + "._-")
 
 
-async def fetch_quote_via_playwright(symbol: str, timeout_ms: int):
-    try:
-        from playwright.async_api import async_playwright
-    except Exception as e:
-        raise RuntimeError("playwright not installed; install requirements-browser.txt and run: python -m playwright install chromium") from e
+def _quote_sym(sym: str) -> str:
+    return sym if all(c in _SYM_SAFE for c in sym) else urllib.request.quote(sym)
 
-    sym = str(symbol).lower()
-    url = f"https://stooq.com/q/?s={urllib.request.quote(sym)}"
 
-    async with async_playwright() as p:
-        browser = await p.chromium.launch(headless=True)
-        page = await browser.new_page()
-        try:
-            await page.goto(url, wait_until="domcontentloaded", timeout=timeout_ms)
-            data = await page.evaluate(
-                """
-                (s) => {
-                  const sym = String(s).toLowerCase();
-                  const lastCandidates = [2,0,3,1,4,5,6,7,8,9].map(d => `aq_${sym}_c${d}|3`);
-                  let last = null;
-                  let last_id = null;
-                  for (const id of lastCandidates) {
-                    const el = document.getElementById(id);
-                    if (el) { last_id = id; last = (el.textContent || "").trim(); break; }
-                  }
-                  const ids = {
-                    date: `aq_${sym}_d2`,
-                    time: `aq_${sym}_t1`,
-                    change: `aq_${sym}_m2`,
-                    change_pct: `aq_${sym}_m3`,
-                    high: `aq_${sym}_h`,
-                    low: `aq_${sym}_l`,
-                    open: `aq_${sym}_o`,
-                    prev: `aq_${sym}_p`,
-                    volume: `aq_${sym}_v2`,
-                    turnover: `aq_${sym}_r2`,
-                  };
-                  const out = {};
-                  out.last = last;
-                  out.last_id = last_id;
-                  for (const [k, id] of Object.entries(ids)) {
-                    const el = document.getElementById(id);
-                    out[k] = el ? (el.textContent || "").trim() : null;
-                  }
-                  return out;
-                }
-                """,
-                sym,
-            )
-            return data
-        finally:
-            await page.close()
-            await browser.close()
+HTTP_HEADERS = {
+    "User-Agent": "stooq-quote-fetcher/0.1 (+https://stooq.com/)",
+    "Accept": "text/html,application/xhtml+xml",
+    "Accept-Language": "en-US,en;q=0.9",
+}
 
 
-def build_quote_from_playwright_raw(symbol: str, raw: dict):
-    sym = str(symbol).lower()
+def fetch_quote_html(sym: str, timeout_ms: int) -> bytes:
+    url = f"https://stooq.com/q/?s={_quote_sym(sym)}"
+    req = urllib.request.Request(url, headers=HTTP_HEADERS, method="GET")
+    with urllib.request.urlopen(req, timeout=timeout_ms / 1000.0) as resp:
+        return resp.read()
+
+
+async def fetch_quote_html_async(session, sym: str, timeout_ms: int) -> bytes:
+    url = f"https://stooq.com/q/?s={_quote_sym(sym)}"
+    try:
+        async with session.get(url, headers=HTTP_HEADERS, timeout=aiohttp.ClientTimeout(total=timeout_ms / 1000.0)) as resp:
+            if resp.status >= 400:
+                # Same wording as urllib's HTTPError, which the JSON error messages used before.
+                raise RuntimeError(f"HTTP Error {resp.status}: {resp.reason}")
+            return await resp.read()
+    except asyncio.TimeoutError as e:
+        raise RuntimeError(f"timed out after {timeout_ms}ms") from e
+
+
+# Installed once per browser context via add_init_script; pages then call the
+# pre-parsed window.__stooqExtract instead of receiving the extractor source each time.
+PLAYWRIGHT_EXTRACT_JS = """
+window.__stooqExtract = (s) => {
+  const sym = String(s).toLowerCase();
+  const lastCandidates = [2,0,3,1,4,5,6,7,8,9].map(d => `aq_${sym}_c${d}|3`);
+  let last = null;
+  let last_id = null;
+  for (const id of lastCandidates) {
+    const el = document.getElementById(id);
+    if (el) { last_id = id; last = (el.textContent || "").trim(); break; }
+  }
+  const ids = {
+    date: `aq_${sym}_d2`,
+    time: `aq_${sym}_t1`,
+    change: `aq_${sym}_m2`,
+    change_pct: `aq_${sym}_m3`,
+    high: `aq_${sym}_h`,
+    low: `aq_${sym}_l`,
+    open: `aq_${sym}_o`,
+    prev: `aq_${sym}_p`,
+    volume: `aq_${sym}_v2`,
+    turnover: `aq_${sym}_r2`,
+  };
+  const out = {};
+  out.last = last;
+  out.last_id = last_id;
+  for (const [k, id] of Object.entries(ids)) {
+    const el = document.getElementById(id);
+    out[k] = el ? (el.textContent || "").trim() : null;
+  }
+  return out;
+};
+"""
+
+
+async def fetch_quote_via_playwright(context, sym: str, timeout_ms: int):
+    url = f"https://stooq.com/q/?s={_quote_sym(sym)}"
+
+    page = await context.new_page()
+    try:
+        await page.goto(url, wait_until="domcontentloaded", timeout=timeout_ms)
+        data = await page.evaluate("(s) => window.__stooqExtract(s)", sym)
+        return data
+    finally:
+        await page.close()
+
+
+def build_quote_from_playwright_raw(sym: str, raw: dict, include_raw: bool = True):
     r = raw or {}
     out = {
         "symbol": sym,
@@ -202,50 +286,115 @@ def build_quote_from_playwright_raw(symbol: str, raw: dict):
         "prev": parse_number_loose(r.get("prev")),
         "volume": parse_number_loose(r.get("volume")),
         "turnover": parse_number_loose(r.get("turnover")),
-        "raw": {k: r.get(k) for k in ["last", "last_id", "date", "time", "change", "change_pct", "high", "low", "open", "prev", "volume", "turnover"]},
     }
+    if include_raw:
+        out["raw"] = {k: r.get(k) for k in ["last", "last_id", "date", "time", "change", "change_pct", "high", "low", "open", "prev", "volume", "turnover"]}
     return out
 
 
 def fmt_missing(v):
-    return "-" if v is None or v == "" else str(v)
+    if isinstance(v, str):
+        return v or "-"
+    return "-" if v is None else str(v)
 
 
 def fmt_change_pct(v):
-    if v is None:
-        return "-"
-    try:
-        n = float(v)
-    except Exception:
+    # Parsed values are floats or None; anything else renders as missing.
+    if not isinstance(v, (int, float)):
         return "-"
+    n = float(v)
     sign = "+" if n > 0 else ""
     return f"{sign}{n}%"
 
 
-def render_table(quotes):
+TABLE_HEADERS = ["Symbol", "Last", "Date", "Time", "Change", "Change%", "High", "Low", "Open", "Prev", "Volume", "Turnover"]
+
+
+def table_row(q):
+    return [
+        fmt_missing(q.get("symbol")),
+        fmt_missing(q.get("last")),
+        fmt_missing(q.get("date")),
+        fmt_missing(q.get("time")),
+        fmt_missing(q.get("change")),
+        fmt_change_pct(q.get("change_pct")),
+        fmt_missing(q.get("high")),
+        fmt_missing(q.get("low")),
+        fmt_missing(q.get("open")),
+        fmt_missing(q.get("prev")),
+        fmt_missing(q.get("volume")),
+        fmt_missing(q.get("turnover")),
+    ]
+
+
+def _cell_rank(s: str) -> int:
+    # Same numeric detection tabulate used for this table: 2 = int, 3 = float, 5 = str.
     try:
-        from tabulate import tabulate  # type: ignore
-    except Exception as e:
-        raise RuntimeError("tabulate not installed; install requirements.txt (pip install -r requirements.txt)") from e
-
-    headers = ["Symbol", "Last", "Date", "Time", "Change", "Change%", "High", "Low", "Open", "Prev", "Volume", "Turnover"]
-    rows = []
-    for q in quotes:
-        rows.append([
-            q.get("symbol"),
-            fmt_missing(q.get("last")),
-            fmt_missing(q.get("date")),
-            fmt_missing(q.get("time")),
-            fmt_missing(q.get("change")),
-            fmt_change_pct(q.get("change_pct")),
-            fmt_missing(q.get("high")),
-            fmt_missing(q.get("low")),
-            fmt_missing(q.get("open")),
-            fmt_missing(q.get("prev")),
-            fmt_missing(q.get("volume")),
-            fmt_missing(q.get("turnover")),
-        ])
-    return tabulate(rows, headers=headers, tablefmt="github")
+        int(s)
+        return 2
+    except ValueError:
+        pass
+    try:
+        f = float(s)
+    except ValueError:
+        return 5
+    if math.isinf(f) or math.isnan(f):
+        return 3 if s.lower() in ("inf", "-inf", "nan") else 5
+    return 3
+
+
+def _afterpoint(s: str) -> int:
+    # Digits after the decimal point (or exponent marker), -1 if none; used for decimal alignment.
+    if _cell_rank(s) != 3:
+        return -1
+    pos = s.rfind(".")
+    if pos < 0:
+        pos = s.lower().rfind("e")
+    return len(s) - pos - 1 if pos >= 0 else -1
+
+
+def write_table(quotes, out):
+    # GitHub-style markdown table matching tabulate's defaults (tablefmt="github"):
+    # numeric columns are %g-formatted and right-aligned on the decimal point,
+    # text columns are left-aligned, and columns are at least header width + 2.
+    rows = [table_row(q) for q in quotes]
+    numeric = []
+    widths = []
+    for i, header in enumerate(TABLE_HEADERS):
+        rank = max((_cell_rank(r[i]) for r in rows), default=5)
+        numeric.append(rank < 5)
+        if rank == 3:
+            for r in rows:
+                r[i] = format(float(r[i]), "g")
+        if rank < 5:
+            decimals = [_afterpoint(r[i]) for r in rows]
+            most = max(decimals)
+            for r, d in zip(rows, decimals):
+                r[i] += " " * (most - d)
+        else:
+            for r in rows:
+                r[i] = r[i].strip()
+        widths.append(max([len(header) + 2] + [len(r[i]) for r in rows]))
+
+    def line(cells):
+        return "| " + " | ".join(c.rjust(w) if num else c.ljust(w) for c, w, num in zip(cells, widths, numeric)) + " |\n"
+
+    out.write(line(TABLE_HEADERS))
+    out.write("|" + "|".join("-" * (w + 2) for w in widths) + "|\n")
+    for r in rows:
+        out.write(line(r))
+
+
+def write_json(obj):
+    out = getattr(sys.stdout, "buffer", None)
+    if orjson is not None and out is not None:
+        # orjson returns UTF-8 bytes; flush pending text first to keep output ordered.
+        sys.stdout.flush()
+        out.write(orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE))
+        return
+    # Stream the encoder's chunks rather than building the whole document as one str.
+    json.dump(obj, sys.stdout, indent=2)
+    sys.stdout.write("\n")
 
 
 def parse_symbols(symbols_opt: str, symbol_list_opt):
@@ -254,34 +403,172 @@ def parse_symbols(symbols_opt: str, symbol_list_opt):
         out.extend(symbol_list_opt)
     if symbols_opt:
         out.extend([s.strip() for s in str(symbols_opt).split(",") if s.strip()])
-    uniq = []
-    seen = set()
-    for s in out:
-        ss = str(s).lower()
-        if ss and ss not in seen:
-            seen.add(ss)
-            uniq.append(ss)
+    # dict.fromkeys dedupes in one pass while keeping first-seen order.
+    uniq = [s for s in dict.fromkeys(str(s).lower() for s in out) if s]
     if not uniq:
         raise RuntimeError("no symbols provided (use --symbols or --symbol)")
     return uniq
 
 
-def fetch_one_http(symbol, timeout_ms):
-    html = fetch_quote_html(symbol, timeout_ms)
-    q = parse_quote_html(html, symbol)
+HTML_CACHE_DIR = os.path.expanduser("~/.cache/stooq_instant")
+
+
+def open_html_cache():
+    try:
+        import diskcache  # type: ignore
+    except Exception as e:
+        raise RuntimeError("diskcache not installed; install requirements-cache.txt (pip install -r requirements-cache.txt)") from e
+    return diskcache.Cache(HTML_CACHE_DIR)
+
+
+def html_cache_key(symbol):
+    # Stooq quotes update about once a minute; pages fetched within the same minute are reused.
+    return f"{symbol}:{int(time.time() // 60)}"
+
+
+def fetch_one_http(symbol, timeout_ms, include_raw=True, cache=None):
+    key = html_cache_key(symbol) if cache is not None else None
+    html = cache.get(key) if cache is not None else None
+    fetched = html is None
+    if fetched:
+        html = fetch_quote_html(symbol, timeout_ms)
+    q = parse_quote_html(html, symbol, include_raw)
+    if not validate_parsed_quote(q):
+        raise RuntimeError("parsed quote missing required fields (http)")
+    if fetched and cache is not None:
+        # Only cache pages that parsed, so a blocked or broken page is retried next run.
+        cache.set(key, html, expire=120)
+    return q
+
+
+async def fetch_one_http_async(session, symbol, timeout_ms, parse_executor=None, include_raw=True, cache=None, fetch_sem=None):
+    loop = asyncio.get_running_loop()
+
+    async def off_loop(fn, *args):
+        # Parsing and cache (SQLite) calls block; with a parse executor, keep them off the
+        # event loop so other in-flight fetches keep making progress meanwhile.
+        if parse_executor is None:
+            return fn(*args)
+        return await loop.run_in_executor(parse_executor, fn, *args)
+
+    key = html_cache_key(symbol) if cache is not None else None
+    html = await off_loop(cache.get, key) if cache is not None else None
+    fetched = html is None
+    if fetched and fetch_sem is not None:
+        # Wait for a slot before starting the request so --timeout-ms covers only the request itself.
+        async with fetch_sem:
+            html = await fetch_quote_html_async(session, symbol, timeout_ms)
+    elif fetched:
+        html = await fetch_quote_html_async(session, symbol, timeout_ms)
+    q = await off_loop(parse_quote_html, html, symbol, include_raw)
     if not validate_parsed_quote(q):
         raise RuntimeError("parsed quote missing required fields (http)")
+    if fetched and cache is not None:
+        await off_loop(functools.partial(cache.set, key, html, expire=120))
     return q
 
 
-async def fetch_one_playwright(symbol, timeout_ms):
-    raw = await fetch_quote_via_playwright(symbol, timeout_ms)
-    q = build_quote_from_playwright_raw(symbol, raw)
+async def run_all_http(symbols, timeout_ms, concurrency, include_raw=True, cache=None):
+    # One session for the whole batch so connections to stooq.com are kept alive and reused.
+    # trust_env honours HTTP(S)_PROXY / NO_PROXY like urllib's default ProxyHandler.
+    connector = aiohttp.TCPConnector(limit=concurrency, ttl_dns_cache=300)
+    results = {}
+    errors = {}
+    if concurrency == 1:
+        # Default sequential mode: await each symbol in order; no tasks, gather or parse executor.
+        async with aiohttp.ClientSession(connector=connector, trust_env=True) as session:
+            for sym in symbols:
+                try:
+                    results[sym] = await fetch_one_http_async(session, sym, timeout_ms, None, include_raw, cache)
+                except Exception as e:
+                    errors[sym] = e
+        return results, errors
+
+    # aiohttp's total timeout also counts time queued for a pooled connection; gate requests instead.
+    fetch_sem = asyncio.Semaphore(concurrency)
+    # Parsing is CPU-bound and holds the GIL, so a single worker is enough to overlap it with network I/O.
+    with ThreadPoolExecutor(max_workers=1) as parse_executor:
+        async with aiohttp.ClientSession(connector=connector, trust_env=True) as session:
+            outs = await asyncio.gather(
+                *[fetch_one_http_async(session, sym, timeout_ms, parse_executor, include_raw, cache, fetch_sem) for sym in symbols],
+                return_exceptions=True,
+            )
+    for sym, out in zip(symbols, outs):
+        if isinstance(out, Exception):
+            errors[sym] = out
+        else:
+            results[sym] = out
+    return results, errors
+
+
+def fetch_all_http(symbols, timeout_ms, concurrency, include_raw=True, cache=None):
+    if aiohttp is not None:
+        return asyncio.run(run_all_http(symbols, timeout_ms, concurrency, include_raw, cache))
+
+    # Without aiohttp, fall back to urllib on a thread pool (one connection per symbol).
+    results = {}
+    errors = {}
+    if concurrency == 1:
+        # Default sequential mode: plain calls, no executor/futures overhead.
+        for sym in symbols:
+            try:
+                results[sym] = fetch_one_http(sym, timeout_ms, include_raw, cache)
+            except Exception as e:
+                errors[sym] = e
+        return results, errors
+    with ThreadPoolExecutor(max_workers=concurrency) as ex:
+        futs = {ex.submit(fetch_one_http, sym, timeout_ms, include_raw, cache): sym for sym in symbols}
+        for fut in as_completed(futs):
+            sym = futs[fut]
+            try:
+                results[sym] = fut.result()
+            except Exception as e:
+                errors[sym] = e
+    return results, errors
+
+
+async def fetch_one_playwright(context, symbol, timeout_ms, include_raw=True):
+    raw = await fetch_quote_via_playwright(context, symbol, timeout_ms)
+    q = build_quote_from_playwright_raw(symbol, raw, include_raw)
     if not validate_parsed_quote(q):
         raise RuntimeError("parsed quote missing required fields (playwright)")
     return q
 
 
+async def run_all_playwright(symbols, timeout_ms, concurrency, mode, include_raw=True):
+    try:
+        from playwright.async_api import async_playwright
+    except Exception as e:
+        raise RuntimeError("playwright not installed; install requirements-browser.txt and run: python -m playwright install chromium") from e
+
+    # Launch Chromium once per batch; each symbol only opens a page in the shared context.
+    sem = asyncio.Semaphore(concurrency)
+    async with async_playwright() as p:
+        browser = await p.chromium.launch(headless=True)
+        try:
+            context = await browser.new_context()
+            await context.add_init_script(script=PLAYWRIGHT_EXTRACT_JS)
+
+            async def run_one(sym):
+                async with sem:
+                    try:
+                        return await fetch_one_playwright(context, sym, timeout_ms, include_raw)
+                    except Exception as e:
+                        return {"symbol": sym, "error": {"message": str(e), "mode": mode}}
+
+            outs = await asyncio.gather(*[run_one(sym) for sym in symbols])
+        finally:
+            await browser.close()
+    return dict(zip(symbols, outs))
+
+
+def fetch_all_playwright(symbols, timeout_ms, concurrency, mode, include_raw=True):
+    try:
+        return asyncio.run(run_all_playwright(symbols, timeout_ms, concurrency, mode, include_raw))
+    except Exception as e:
+        return {sym: {"symbol": sym, "error": {"message": str(e), "mode": mode}} for sym in symbols}
+
+
 def main():
     ap = argparse.ArgumentParser(description="Fetch latest quotes from stooq.com via HTTP or Playwright; output JSON or table.")
     ap.add_argument("--symbols", help="comma-separated symbols, e.g. gc.f,btc.v")
@@ -289,8 +576,9 @@ def main():
     ap.add_argument("--mode", default="auto", help="http|playwright|auto")
     ap.add_argument("--format", default="table", help="json|table|both")
     ap.add_argument("--no-raw", action="store_true", help="omit the 'raw' object from JSON output")
+    ap.add_argument("--cache", action="store_true", help=f"reuse HTTP pages fetched within the same minute (needs diskcache; stored in {HTML_CACHE_DIR})")
     ap.add_argument("--timeout-ms", type=int, default=15000)
-    ap.add_argument("--concurrency", type=int, default=1, help="concurrency for http/auto (default 1 to avoid parallel traffic)")
+    ap.add_argument("--concurrency", type=int, default=1, help="concurrency for http/auto and playwright pages (default 1 to avoid parallel traffic)")
     args = ap.parse_args()
 
     symbols = parse_symbols(args.symbols, args.symbol)
@@ -303,29 +591,27 @@ def main():
         raise SystemExit(f"invalid --mode {mode}")
     if fmt not in ("json", "table", "both"):
         raise SystemExit(f"invalid --format {fmt}")
+    if args.cache and mode == "playwright":
+        raise SystemExit("--cache only applies to http/auto modes (it caches HTTP pages)")
 
+    # Skip building the debug "raw" object entirely when it would only be stripped later.
+    include_raw = not args.no_raw
     results = []
 
     if mode == "playwright":
-        async def run():
-            for sym in symbols:
-                try:
-                    q = await fetch_one_playwright(sym, timeout_ms)
-                    results.append((sym, q))
-                except Exception as e:
-                    results.append((sym, {"symbol": sym, "error": {"message": str(e), "mode": mode}}))
-        asyncio.run(run())
+        pw_results = fetch_all_playwright(symbols, timeout_ms, concurrency, mode, include_raw)
+        for sym in symbols:
+            results.append((sym, pw_results[sym]))
     else:
-        http_results = {}
-        http_errors = {}
-        with ThreadPoolExecutor(max_workers=concurrency) as ex:
-            futs = {ex.submit(fetch_one_http, sym, timeout_ms): sym for sym in symbols}
-            for fut in as_completed(futs):
-                sym = futs[fut]
-                try:
-                    http_results[sym] = fut.result()
-                except Exception as e:
-                    http_errors[sym] = e
+        try:
+            cache = open_html_cache() if args.cache else None
+        except RuntimeError as e:
+            raise SystemExit(str(e))
+        try:
+            http_results, http_errors = fetch_all_http(symbols, timeout_ms, concurrency, include_raw, cache)
+        finally:
+            if cache is not None:
+                cache.close()
 
         if mode == "http":
             for sym in symbols:
@@ -335,19 +621,9 @@ def main():
                     e = http_errors.get(sym)
                     results.append((sym, {"symbol": sym, "error": {"message": str(e) if e else "http fetch/parse failed", "mode": "http"}}))
         else:
-            # auto: retry only the failed symbols via playwright (sequential; keeps it simple and stable)
+            # auto: retry only the failed symbols via playwright, sharing one browser across them.
             fallback = [sym for sym in symbols if sym not in http_results]
-
-            async def run_fallback():
-                out = {}
-                for sym in fallback:
-                    try:
-                        out[sym] = await fetch_one_playwright(sym, timeout_ms)
-                    except Exception as e:
-                        out[sym] = {"symbol": sym, "error": {"message": str(e), "mode": "auto"}}
-                return out
-
-            fallback_results = asyncio.run(run_fallback()) if fallback else {}
+            fallback_results = fetch_all_playwright(fallback, timeout_ms, concurrency, "auto", include_raw) if fallback else {}
 
             for sym in symbols:
                 if sym in http_results:
@@ -355,40 +631,28 @@ def main():
                 else:
                     results.append((sym, fallback_results.get(sym) or {"symbol": sym, "error": {"message": "auto fetch failed", "mode": "auto"}}))
 
-    # Drop the (symbol, result) tuples now that we restored ordering.
-    results = [r for _, r in results]
-
-    failures = [r for r in results if r and isinstance(r, dict) and r.get("error")]
-    json_results = results
-    if args.no_raw:
-        json_results = []
-        for r in results:
-            if r and isinstance(r, dict) and (not r.get("error")):
-                rr = dict(r)
-                rr.pop("raw", None)
-                json_results.append(rr)
-            else:
-                json_results.append(r)
+    # One pass: ordered records for JSON, table rows (failures as blank rows), and failures.
+    records = []
+    table_rows = []
+    failures = []
+    for sym, r in results:
+        records.append(r)
+        if r.get("error"):
+            failures.append(r)
+            table_rows.append({"symbol": sym})
+        else:
+            table_rows.append(r)
 
     if fmt in ("json", "both"):
-        sys.stdout.write(json.dumps(json_results, indent=2) + "\n")
+        write_json(records)
         if fmt == "json":
             return 2 if failures else 0
         sys.stdout.write("\n")
 
     # Table; also print failures to stderr.
-    successes_or_blanks = []
-    failures = []
-    for r in results:
-        if r and r.get("error"):
-            failures.append(r)
-            successes_or_blanks.append({"symbol": r.get("symbol")})
-        else:
-            successes_or_blanks.append(r)
-
-    sys.stdout.write(render_table(successes_or_blanks) + "\n")
+    write_table(table_rows, sys.stdout)
     if failures:
-        sys.stderr.write(f"\nFailures ({len(failures)}/{len(results)}):\n")
+        sys.stderr.write(f"\nFailures ({len(failures)}/{len(records)}):\n")
         for f in failures:
             sys.stderr.write(f"- {f.get('symbol')}: {f.get('error', {}).get('message')}\n")
         return 2